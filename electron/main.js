@@ -1,9 +1,15 @@
-const { app, BrowserWindow, ipcMain, shell } = require('electron');
+const { app, BrowserWindow, ipcMain, nativeImage, shell } = require('electron');
 const path = require('path');
 const fs = require('fs');
 const { spawn } = require('child_process');
 
 let mainWindow;
+const thumbnailJobs = new Map();
+
+const THUMB_SIZE = 400;
+const THUMB_QUALITY = 82;
+const FRAME_EXT = /\.(png|jpg|webp)$/;
+const FRAME_NAME = /^frame_\d+\.(png|jpg|webp)$/;
 
 function createWindow() {
   mainWindow = new BrowserWindow({
@@ -39,19 +45,82 @@ app.on('activate', () => {
   }
 });
 
+function readImageSize(filePath) {
+  const header = Buffer.alloc(4096);
+  const fd = fs.openSync(filePath, 'r');
+  let bytes;
+  try {
+    bytes = fs.readSync(fd, header, 0, header.length, 0);
+  } finally {
+    fs.closeSync(fd);
+  }
+
+  // PNG: dimensions live in the IHDR chunk
+  if (bytes >= 24 && header.readUInt32BE(0) === 0x89504e47) {
+    return { width: header.readUInt32BE(16), height: header.readUInt32BE(20) };
+  }
+
+  // JPEG: walk the segment markers up to the first start-of-frame
+  if (bytes >= 4 && header.readUInt16BE(0) === 0xffd8) {
+    let offset = 2;
+    while (offset + 9 < bytes && header[offset] === 0xff) {
+      const marker = header[offset + 1];
+      if (marker >= 0xc0 && marker <= 0xcf && marker !== 0xc4 && marker !== 0xc8 && marker !== 0xcc) {
+        return { width: header.readUInt16BE(offset + 7), height: header.readUInt16BE(offset + 5) };
+      }
+      offset += 2 + header.readUInt16BE(offset + 2);
+    }
+  }
+
+  // WebP: size sits in the first chunk, encoded per chunk type
+  if (bytes >= 30 && header.toString('ascii', 0, 4) === 'RIFF' && header.toString('ascii', 8, 12) === 'WEBP') {
+    const chunk = header.toString('ascii', 12, 16);
+    if (chunk === 'VP8 ') {
+      return { width: header.readUInt16LE(26) & 0x3fff, height: header.readUInt16LE(28) & 0x3fff };
+    }
+    if (chunk === 'VP8L') {
+      const bits = header.readUInt32LE(21);
+      return { width: (bits & 0x3fff) + 1, height: ((bits >> 14) & 0x3fff) + 1 };
+    }
+    if (chunk === 'VP8X') {
+      return { width: header.readUIntLE(24, 3) + 1, height: header.readUIntLE(27, 3) + 1 };
+    }
+  }
+
+  return {};
+}
+
+function findCachedThumbnail(framesDir, name, thumbNames) {
+  const thumbName = name.replace(FRAME_EXT, '.jpg');
+  if (!thumbNames.has(thumbName)) return null;
+
+  const thumbPath = path.join(framesDir, '.thumbs', thumbName);
+  const thumbStat = fs.statSync(thumbPath, { throwIfNoEntry: false });
+  if (thumbStat && thumbStat.size > 0 && thumbStat.mtimeMs >= fs.statSync(path.join(framesDir, name)).mtimeMs) {
+    return thumbPath;
+  }
+  return null;
+}
+
 // IPC handlers
 ipcMain.handle('load-frames', async () => {
   const framesDir = path.join(process.cwd(), 'frames');
   const metadataPath = path.join(framesDir, '.metadata.json');
 
   try {
-    const files = fs.readdirSync(framesDir)
-      .filter(f => f.endsWith('.png'))
+    // One directory listing per folder; only existing thumbnails are stat'ed
+    const thumbDir = path.join(framesDir, '.thumbs');
+    const thumbNames = new Set(fs.existsSync(thumbDir) ? fs.readdirSync(thumbDir) : []);
+    const files = fs.readdirSync(framesDir, { withFileTypes: true })
+      .filter(entry => entry.isFile() && FRAME_NAME.test(entry.name))
+      .map(entry => entry.name)
       .sort()
       .map(f => ({
         name: f,
         path: path.join(framesDir, f),
-        pageBreak: false
+        pageBreak: false,
+        thumbnail: findCachedThumbnail(framesDir, f, thumbNames),
+        ...readImageSize(path.join(framesDir, f))
       }));
 
     // Load page breaks from metadata if it exists
@@ -72,51 +141,106 @@ ipcMain.handle('load-frames', async () => {
   }
 });
 
+async function ensureThumbnail(framesDir, name) {
+  const thumbDir = path.join(framesDir, '.thumbs');
+  const framePath = path.join(framesDir, name);
+  const thumbPath = path.join(thumbDir, name.replace(FRAME_EXT, '.jpg'));
+
+  const [frameStat, thumbStat] = await Promise.all([
+    fs.promises.stat(framePath),
+    fs.promises.stat(thumbPath).catch(() => null)
+  ]);
+  if (thumbStat && thumbStat.size > 0 && thumbStat.mtimeMs >= frameStat.mtimeMs) {
+    return thumbPath;
+  }
+
+  const [buffer] = await Promise.all([
+    fs.promises.readFile(framePath),
+    fs.promises.mkdir(thumbDir, { recursive: true })
+  ]);
+
+  // Decodes run on the main process thread, so yield between them to keep IPC responsive
+  await new Promise(resolve => setImmediate(resolve));
+
+  // nativeImage only decodes PNG and JPEG; Chromium can show other formats (WebP) from the frame itself
+  const image = nativeImage.createFromBuffer(buffer);
+  if (image.isEmpty()) {
+    return framePath;
+  }
+
+  const { width, height } = image.getSize();
+  const scale = Math.min(1, THUMB_SIZE / width, THUMB_SIZE / height);
+  const thumb = scale < 1
+    ? image.resize({ width: Math.round(width * scale), height: Math.round(height * scale), quality: 'good' })
+    : image;
+
+  await fs.promises.writeFile(thumbPath, thumb.toJPEG(THUMB_QUALITY));
+  return thumbPath;
+}
+
+ipcMain.handle('get-thumbnail', async (event, name) => {
+  const framesDir = path.join(process.cwd(), 'frames');
+  try {
+    let job = thumbnailJobs.get(name);
+    if (!job) {
+      job = ensureThumbnail(framesDir, name).finally(() => thumbnailJobs.delete(name));
+      thumbnailJobs.set(name, job);
+    }
+    return await job;
+  } catch (err) {
+    console.error('Thumbnail generation failed for', name, err);
+    return path.join(framesDir, name);
+  }
+});
+
 ipcMain.handle('save-frames', async (event, frames, cropValues) => {
   const framesDir = path.join(process.cwd(), 'frames');
-  const tempDir = path.join(framesDir, 'temp_rename');
+  const thumbDir = path.join(framesDir, '.thumbs');
   const metadataPath = path.join(framesDir, '.metadata.json');
 
   console.log('Starting save operation with', frames.length, 'frames');
   console.log('Crop values:', cropValues);
 
   try {
-    // Create temp directory
-    console.log('Creating temp directory...');
-    if (!fs.existsSync(tempDir)) {
-      fs.mkdirSync(tempDir, { recursive: true });
-    }
-
-    // Copy files with new names
-    console.log('Copying files...');
-    frames.forEach((frame, idx) => {
-      const oldPath = path.join(framesDir, frame.name);
-      const newName = `frame_${String(idx).padStart(6, '0')}.png`;
-      const newPath = path.join(tempDir, newName);
-      fs.copyFileSync(oldPath, newPath);
-    });
-
-    // Remove old files
-    console.log('Removing old files...');
-    const oldFiles = fs.readdirSync(framesDir)
-      .filter(f => f.startsWith('frame_') && f.endsWith('.png'));
-    oldFiles.forEach(f => {
-      fs.unlinkSync(path.join(framesDir, f));
-    });
-
-    // Move new files back
-    console.log('Moving new files back...');
-    const newFiles = fs.readdirSync(tempDir);
-    newFiles.forEach(f => {
-      fs.renameSync(
-        path.join(tempDir, f),
-        path.join(framesDir, f)
-      );
+    const fsp = fs.promises;
+    const thumbName = (name) => name.replace(FRAME_EXT, '.jpg');
+    const stageName = (idx) => `.pending_${String(idx).padStart(6, '0')}${path.extname(frames[idx].name)}`;
+    const finalName = (idx) => `frame_${String(idx).padStart(6, '0')}${path.extname(frames[idx].name)}`;
+    const renameIfExists = (from, to) => fsp.rename(from, to).catch(err => {
+      if (err.code !== 'ENOENT') throw err;
     });
 
-    // Remove temp directory
-    console.log('Removing temp directory...');
-    fs.rmdirSync(tempDir);
+    // Frames already at their final name are left untouched
+    const moved = frames.map((frame, idx) => idx).filter(idx => frames[idx].name !== finalName(idx));
+    const settledThumbs = new Set(frames.filter((frame, idx) => frame.name === finalName(idx)).map(frame => thumbName(frame.name)));
+    console.log(`Renaming ${moved.length} of ${frames.length} frames`);
+
+    // Remove frames that are no longer part of the edit
+    console.log('Removing deleted frames...');
+    const keep = new Set(frames.map(frame => frame.name));
+    const framesDirFiles = await fsp.readdir(framesDir);
+    await Promise.all(framesDirFiles
+      .filter(f => FRAME_NAME.test(f) && !keep.has(f))
+      .map(f => fsp.unlink(path.join(framesDir, f))));
+
+    // Stage every moved frame (and its thumbnail) under a name that cannot collide
+    console.log('Staging frames...');
+    await Promise.all(moved.map(idx => Promise.all([
+      fsp.rename(path.join(framesDir, frames[idx].name), path.join(framesDir, stageName(idx))),
+      renameIfExists(path.join(thumbDir, thumbName(frames[idx].name)), path.join(thumbDir, thumbName(stageName(idx))))
+    ])));
+
+    const thumbFiles = await fsp.readdir(thumbDir).catch(() => []);
+    await Promise.all(thumbFiles
+      .filter(f => f.startsWith('frame_') && !settledThumbs.has(f))
+      .map(f => fsp.unlink(path.join(thumbDir, f))));
+
+    // Rename staged frames to their final sequential names
+    console.log('Renaming frames...');
+    await Promise.all(moved.map(idx => Promise.all([
+      fsp.rename(path.join(framesDir, stageName(idx)), path.join(framesDir, finalName(idx))),
+      renameIfExists(path.join(thumbDir, thumbName(stageName(idx))), path.join(thumbDir, thumbName(finalName(idx))))
+    ])));
 
     // Extract page break indices and save metadata
     const pageBreaks = frames
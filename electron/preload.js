@@ -2,6 +2,7 @@ const { contextBridge, ipcRenderer } = require('electron');
 
 contextBridge.exposeInMainWorld('electronAPI', {
   loadFrames: () => ipcRenderer.invoke('load-frames'),
+  getThumbnail: (name) => ipcRenderer.invoke('get-thumbnail', name),
   saveFrames: (frames, cropValues) => ipcRenderer.invoke('save-frames', frames, cropValues),
   previewPdf: (frames, cropValues) => ipcRenderer.invoke('preview-pdf', frames, cropValues),
   deleteFrames: (frames) => ipcRenderer.invoke('delete-frames', frames),
@@ -2,11 +2,32 @@ let frames = [];
 let selectedIndices = new Set();
 let lastClicked = null;
 let cropValues = { top: 0, bottom: 0, left: 0, right: 0 };
+let rowOffsets = [];
+let containerHeight = -1;
+let renderedRange = { first: 0, last: -1 };
+let renderScheduled = false;
+let rowPool = [];
+let pendingThumbnails = new Map();
+let thumbnailFlushScheduled = false;
+let thumbnailCache = new Map();
+let rowTemplateElement = null;
+
+const THUMB_MAX = 400;
+const CARD_CHROME = 52;
+const CARD_TEXT_H = 110;
+const CARD_H = THUMB_MAX + CARD_CHROME;
+const ROW_GAP = 16;
+const BREAK_H = 40;
+const OVERSCAN = 3;
+const THUMB_CACHE_MAX = 200;
+const FLAT_MODE_THRESHOLD = 500;
 
 // Load frames on startup
 document.addEventListener('DOMContentLoaded', async () => {
   await loadFrames();
   setupEventListeners();
+  window.addEventListener('scroll', scheduleRenderVisible, { passive: true });
+  window.addEventListener('resize', scheduleRenderVisible);
   setupProgressListener();
 });
 
@@ -17,7 +38,15 @@ function setupProgressListener() {
 
     if (messageEl && detailEl) {
       // Update the detail text with the latest progress
-      detailEl.textContent = message;
+      const lines = message.split('\n');
+      const latest = lines[lines.length - 1];
+      detailEl.textContent = latest;
+
+      const match = latest.match(/(\d+)\/(\d+)/);
+      if (match) {
+        const percent = Math.round((Number(match[1]) / Number(match[2])) * 100);
+        document.getElementById('progress-bar').style.width = `${percent}%`;
+      }
     }
   });
 }
@@ -32,51 +61,277 @@ async function loadFrames() {
   }
 }
 
-function renderFrames() {
-  const container = document.getElementById('frames-container');
-  container.innerHTML = '';
+function layoutRows() {
+  document.getElementById('frames-container').classList.toggle('flat', frames.length > FLAT_MODE_THRESHOLD);
+
+  rowOffsets = [];
+  let y = 0;
+  frames.forEach(frame => {
+    rowOffsets.push(y);
+    y += rowHeight(frame);
+  });
+  if (y !== containerHeight) {
+    containerHeight = y;
+    document.getElementById('frames-container').style.height = `${y}px`;
+  }
+}
+
+function thumbnailSize(frame) {
+  if (!frame.width || !frame.height) return null;
+
+  const scale = Math.min(1, THUMB_MAX / frame.width, THUMB_MAX / frame.height);
+  return { width: Math.round(frame.width * scale), height: Math.round(frame.height * scale) };
+}
+
+function cardHeight(frame) {
+  const size = thumbnailSize(frame);
+  return size ? Math.max(size.height, CARD_TEXT_H) + CARD_CHROME : CARD_H;
+}
+
+function rowHeight(frame) {
+  return cardHeight(frame) + ROW_GAP + (frame.pageBreak ? BREAK_H : 0);
+}
+
+function findRow(y) {
+  let lo = 0;
+  let hi = rowOffsets.length - 1;
+  while (lo < hi) {
+    const mid = (lo + hi + 1) >> 1;
+    if (rowOffsets[mid] <= y) {
+      lo = mid;
+    } else {
+      hi = mid - 1;
+    }
+  }
+  return lo;
+}
+
+function renderFrames(fromIndex = 0) {
+  layoutRows();
+  renderVisible(fromIndex);
+}
+
+function refreshRows(indices) {
+  rowPool.forEach(view => {
+    if (indices.includes(view.index)) {
+      bindRow(view, view.index);
+    }
+  });
+  updateSelection();
+}
 
-  frames.forEach((frame, index) => {
-    const card = document.createElement('div');
-    card.className = 'frame-card bg-slate-800 rounded-xl p-6 border-2 border-slate-700 cursor-pointer';
-    card.dataset.index = index;
+function moveFrame(from, to) {
+  const upper = Math.min(from, to);
+  [frames[from], frames[to]] = [frames[to], frames[from]];
+  selectedIndices.clear();
+  selectedIndices.add(to);
+  lastClicked = to;
+
+  // Swapping neighbours only moves the boundary between them
+  rowOffsets[upper + 1] = rowOffsets[upper] + rowHeight(frames[upper]);
+  refreshRows([upper, upper + 1]);
+  renderVisible();
+}
 
-    const pageBreakBadge = frame.pageBreak ?
-      '<span class="px-3 py-1 bg-purple-500/20 text-purple-300 rounded-full text-xs font-medium">📄 Page Break After</span>' : '';
+function scheduleRenderVisible() {
+  if (renderScheduled) return;
+  renderScheduled = true;
+  requestAnimationFrame(() => {
+    renderScheduled = false;
+    renderVisible();
+  });
+}
 
-    const cropStyle = getCropStyle();
+function rowTemplate() {
+  if (rowTemplateElement) return rowTemplateElement;
 
-    card.innerHTML = `
+  rowTemplateElement = document.createElement('template');
+  rowTemplateElement.innerHTML = `<div class="frame-row">
+    <div class="frame-card bg-slate-800 rounded-xl p-6 border-2 border-slate-700 cursor-pointer">
       <div class="flex items-start gap-6">
         <div class="flex-shrink-0 thumbnail-container">
-          <img src="file://${frame.path}" alt="Frame ${index}" class="thumbnail rounded-lg" style="${cropStyle}">
+          <img class="thumbnail rounded-lg" decoding="async">
         </div>
         <div class="flex-1 min-w-0">
-          <h3 class="text-xl font-bold text-white mb-2">Frame ${index}</h3>
-          <p class="text-slate-400 text-sm truncate">${frame.name}</p>
+          <h3 class="frame-title text-xl font-bold text-white mb-2"></h3>
+          <p class="frame-name text-slate-400 text-sm truncate"></p>
           <div class="mt-4 flex items-center gap-2">
-            <span class="px-3 py-1 bg-blue-500/20 text-blue-300 rounded-full text-xs font-medium">
-              Index: ${index}
-            </span>
-            ${pageBreakBadge}
+            <span class="frame-index px-3 py-1 bg-blue-500/20 text-blue-300 rounded-full text-xs font-medium"></span>
+            <span class="frame-break-badge px-3 py-1 bg-purple-500/20 text-purple-300 rounded-full text-xs font-medium">📄 Page Break After</span>
           </div>
         </div>
       </div>
-    `;
-
-    card.addEventListener('click', (e) => handleFrameClick(index, e));
-    container.appendChild(card);
-
-    // Add page break divider if this frame has one
-    if (frame.pageBreak) {
-      const divider = document.createElement('div');
-      divider.className = 'flex items-center gap-4 my-2';
-      divider.innerHTML = `
-        <div class="flex-1 h-px bg-gradient-to-r from-transparent via-purple-500 to-transparent"></div>
-        <span class="text-purple-400 text-sm font-medium">📄 PAGE BREAK</span>
-        <div class="flex-1 h-px bg-gradient-to-r from-purple-500 via-purple-500 to-transparent"></div>
-      `;
-      container.appendChild(divider);
+    </div>
+    <div class="frame-divider flex items-center gap-4" style="height: ${BREAK_H - ROW_GAP}px; margin-top: ${ROW_GAP}px">
+      <div class="flex-1 h-px bg-gradient-to-r from-transparent via-purple-500 to-transparent"></div>
+      <span class="text-purple-400 text-sm font-medium">📄 PAGE BREAK</span>
+      <div class="flex-1 h-px bg-gradient-to-r from-purple-500 via-purple-500 to-transparent"></div>
+    </div>
+  </div>`;
+
+  return rowTemplateElement;
+}
+
+function createRow() {
+  // Clone a parsed template rather than re-parsing the markup for every row
+  const row = rowTemplate().content.firstElementChild.cloneNode(true);
+
+  return {
+    row,
+    card: row.querySelector('.frame-card'),
+    index: -1,
+    selected: false,
+    img: row.querySelector('.thumbnail'),
+    title: row.querySelector('.frame-title'),
+    name: row.querySelector('.frame-name'),
+    indexBadge: row.querySelector('.frame-index'),
+    breakBadge: row.querySelector('.frame-break-badge'),
+    divider: row.querySelector('.frame-divider')
+  };
+}
+
+function bindRow(view, index) {
+  const frame = frames[index];
+
+  view.index = index;
+  view.row.style.transform = `translateY(${rowOffsets[index]}px)`;
+  view.row.style.display = '';
+  view.card.dataset.index = index;
+  view.card.style.height = `${cardHeight(frame)}px`;
+
+  const size = thumbnailSize(frame);
+  if (size) {
+    view.img.width = size.width;
+    view.img.height = size.height;
+  } else {
+    view.img.removeAttribute('width');
+    view.img.removeAttribute('height');
+  }
+
+  bindThumbnail(view, index);
+  view.img.alt = `Frame ${index}`;
+  view.img.style.cssText = getCropStyle();
+
+  view.title.textContent = `Frame ${index}`;
+  view.name.textContent = frame.name;
+  view.indexBadge.textContent = `Index: ${index}`;
+  view.breakBadge.style.display = frame.pageBreak ? '' : 'none';
+  view.divider.style.display = frame.pageBreak ? '' : 'none';
+}
+
+function getCachedThumbnail(name) {
+  const entry = thumbnailCache.get(name);
+  if (entry === undefined) return undefined;
+
+  thumbnailCache.delete(name);
+  thumbnailCache.set(name, entry);
+  return entry.url;
+}
+
+function cacheThumbnail(name, url) {
+  // Hold a decoded copy so rebinding a row never re-decodes the JPEG
+  const image = new Image();
+  image.src = url;
+  image.decode().catch(() => {});
+
+  thumbnailCache.delete(name);
+  thumbnailCache.set(name, { url, image });
+  while (thumbnailCache.size > THUMB_CACHE_MAX) {
+    thumbnailCache.delete(thumbnailCache.keys().next().value);
+  }
+}
+
+function bindThumbnail(view, index) {
+  const frame = frames[index];
+  let url = getCachedThumbnail(frame.name);
+
+  if (url === undefined && frame.thumbnail) {
+    url = `file://${frame.thumbnail}`;
+    cacheThumbnail(frame.name, url);
+  }
+
+  if (url !== undefined) {
+    if (view.img.getAttribute('src') !== url) {
+      view.img.src = url;
+    }
+    return;
+  }
+
+  view.img.removeAttribute('src');
+  pendingThumbnails.set(view, index);
+  if (!thumbnailFlushScheduled) {
+    thumbnailFlushScheduled = true;
+    requestIdleCallback(flushThumbnails);
+  }
+}
+
+function flushThumbnails() {
+  thumbnailFlushScheduled = false;
+  const pending = Array.from(pendingThumbnails);
+  pendingThumbnails.clear();
+
+  pending.forEach(([view, index]) => {
+    if (view.index !== index) return;
+
+    const frame = frames[index];
+    window.electronAPI.getThumbnail(frame.name).then(thumbPath => {
+      const url = `file://${thumbPath}`;
+      cacheThumbnail(frame.name, url);
+      if (view.index === index && frames[index] === frame) {
+        view.img.src = url;
+      }
+    });
+  });
+}
+
+function releaseRow(view) {
+  view.index = -1;
+  view.row.style.display = 'none';
+  view.img.removeAttribute('src');
+  pendingThumbnails.delete(view);
+}
+
+function renderVisible(dirtyFrom = Infinity) {
+  const container = document.getElementById('frames-container');
+
+  if (frames.length === 0) {
+    rowPool.forEach(releaseRow);
+    renderedRange = { first: 0, last: -1 };
+    return;
+  }
+
+  const viewTop = -container.getBoundingClientRect().top;
+  const first = Math.max(0, findRow(viewTop) - OVERSCAN);
+  const last = Math.min(frames.length - 1, findRow(viewTop + window.innerHeight) + OVERSCAN);
+
+  if (dirtyFrom === Infinity && first === renderedRange.first && last === renderedRange.last) return;
+  renderedRange = { first, last };
+
+  const count = last - first + 1;
+  if (rowPool.length < count) {
+    const fragment = document.createDocumentFragment();
+    while (rowPool.length < count) {
+      const view = createRow();
+      rowPool.push(view);
+      fragment.appendChild(view.row);
+    }
+    container.appendChild(fragment);
+    dirtyFrom = 0;
+  }
+
+  const used = new Set();
+  for (let index = first; index <= last; index++) {
+    const slot = index % rowPool.length;
+    const view = rowPool[slot];
+    used.add(slot);
+    if (index >= dirtyFrom || view.index !== index) {
+      bindRow(view, index);
+    }
+  }
+
+  rowPool.forEach((view, slot) => {
+    if (!used.has(slot) && view.index !== -1) {
+      releaseRow(view);
     }
   });
 
@@ -128,12 +383,11 @@ function handleFrameClick(index, event) {
 }
 
 function updateSelection() {
-  const cards = document.querySelectorAll('.frame-card');
-  cards.forEach((card, index) => {
-    if (selectedIndices.has(index)) {
-      card.classList.add('selected');
-    } else {
-      card.classList.remove('selected');
+  rowPool.forEach(view => {
+    const selected = view.index !== -1 && selectedIndices.has(view.index);
+    if (view.selected !== selected) {
+      view.selected = selected;
+      view.card.classList.toggle('selected', selected);
     }
   });
 }
@@ -148,6 +402,14 @@ function updateInfoLabel() {
 }
 
 function setupEventListeners() {
+  // Single click dispatcher for all frame cards
+  document.getElementById('frames-container').addEventListener('click', (e) => {
+    const card = e.target.closest('.frame-card');
+    if (card) {
+      handleFrameClick(Number(card.dataset.index), e);
+    }
+  });
+
   // Move Up
   document.getElementById('move-up-btn').addEventListener('click', () => {
     if (selectedIndices.size !== 1) return;
@@ -155,11 +417,7 @@ function setupEventListeners() {
     const index = Array.from(selectedIndices)[0];
     if (index === 0) return;
 
-    [frames[index], frames[index - 1]] = [frames[index - 1], frames[index]];
-    selectedIndices.clear();
-    selectedIndices.add(index - 1);
-    lastClicked = index - 1;
-    renderFrames();
+    moveFrame(index, index - 1);
   });
 
   // Move Down
@@ -169,31 +427,27 @@ function setupEventListeners() {
     const index = Array.from(selectedIndices)[0];
     if (index >= frames.length - 1) return;
 
-    [frames[index], frames[index + 1]] = [frames[index + 1], frames[index]];
-    selectedIndices.clear();
-    selectedIndices.add(index + 1);
-    lastClicked = index + 1;
-    renderFrames();
+    moveFrame(index, index + 1);
   });
 
   // Delete
   document.getElementById('delete-btn').addEventListener('click', async () => {
     if (selectedIndices.size === 0) return;
 
-    const indicesToDelete = Array.from(selectedIndices).sort((a, b) => b - a);
-    const framesToDelete = indicesToDelete.map(i => frames[i].name);
+    const deleteSet = new Set(selectedIndices);
+    const firstDeleted = Math.min(...deleteSet);
+    const framesToDelete = Array.from(deleteSet, i => frames[i].name);
 
     try {
       showLoading(true);
       await window.electronAPI.deleteFrames(framesToDelete);
 
-      indicesToDelete.forEach(index => {
-        frames.splice(index, 1);
-      });
+      frames = frames.filter((_, index) => !deleteSet.has(index));
 
       selectedIndices.clear();
       lastClicked = null;
-      renderFrames();
+      renderFrames(firstDeleted);
+      updateInfoLabel();
     } catch (err) {
       alert(`Failed to delete frames: ${err.message}`);
     } finally {
@@ -210,13 +464,17 @@ function setupEventListeners() {
       frames[index].pageBreak = !frames[index].pageBreak;
     });
 
-    renderFrames();
+    renderFrames(Math.min(...selectedIndices));
   });
 
   // Save & Create PDF
   document.getElementById('save-btn').addEventListener('click', async () => {
+    const saveBtn = document.getElementById('save-btn');
+    if (saveBtn.disabled) return;
+    saveBtn.disabled = true;
+
     try {
-      showLoading(true, 'Saving frames and generating PDF...', null);
+      showLoading(true, 'Saving frames and generating PDF...', 0);
 
       const result = await window.electronAPI.saveFrames(frames, cropValues);
 
@@ -225,6 +483,7 @@ function setupEventListeners() {
       window.close();
     } catch (err) {
       showLoading(false);
+      saveBtn.disabled = false;
       alert(`Failed to save: ${err.message}`);
     }
   });
@@ -233,7 +492,7 @@ function setupEventListeners() {
   document.getElementById('preview-pdf-btn').addEventListener('click', async () => {
     try {
       console.log('Generating preview with crop values:', cropValues);
-      showLoading(true, 'Generating PDF preview...', null);
+      showLoading(true, 'Generating PDF preview...', 0);
 
       const result = await window.electronAPI.previewPdf(frames, cropValues);
 
@@ -350,10 +609,14 @@ function navigateDown(shiftKey) {
 }
 
 function scrollToFrame(index) {
-  const cards = document.querySelectorAll('.frame-card');
-  if (cards[index]) {
-    cards[index].scrollIntoView({ behavior: 'smooth', block: 'center' });
-  }
+  if (rowOffsets[index] === undefined) return;
+
+  const container = document.getElementById('frames-container');
+  const containerTop = container.getBoundingClientRect().top + window.scrollY;
+  window.scrollTo({
+    top: containerTop + rowOffsets[index] - (window.innerHeight - cardHeight(frames[index])) / 2,
+    behavior: 'smooth'
+  });
 }
 
 function showLoading(show, message = 'Processing...', progress = null) {
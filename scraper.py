@@ -1,23 +1,36 @@
 #!/usr/bin/env python3
 import argparse
+import hashlib
+import io
 import os
 import sys
 import shutil
+import subprocess
 import cv2
 import numpy as np
 import yt_dlp
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from skimage.metrics import structural_similarity as ssim
 from PIL import Image
+from reportlab import rl_config
 from reportlab.lib.pagesizes import A4
+from reportlab.lib.utils import ImageReader
 from reportlab.pdfgen import canvas
 
 
-def download_video(url, output_path="video.mp4"):
+FRAME_EXTENSIONS = (".png", ".jpg", ".webp")
+
+rl_config.useA85 = 0
+
+
+def download_video(url, output_path="video.mp4", quiet=False):
     ydl_opts = {
         'format': 'best',
         'outtmpl': output_path,
-        'quiet': False,
+        'quiet': quiet,
+        'noprogress': quiet,
     }
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
@@ -26,52 +39,193 @@ def download_video(url, output_path="video.mp4"):
     return output_path
 
 
+def stream_url(url):
+    with yt_dlp.YoutubeDL({'format': 'best', 'quiet': True}) as ydl:
+        info = ydl.extract_info(url, download=False)
+
+    # OpenCV's FFmpeg backend reads plain HTTP(S) media with range requests
+    stream = info.get('url')
+    if not stream or info.get('protocol') not in ('http', 'https'):
+        return None
+
+    cap = cv2.VideoCapture(stream)
+    opened = cap.isOpened()
+    cap.release()
+    return stream if opened else None
+
+
+def to_device(image):
+    return cv2.UMat(image) if cv2.ocl.useOpenCL() else image
+
+
+def to_host(image):
+    return image.get() if isinstance(image, cv2.UMat) else image
+
+
 def crop_black_borders(image, threshold=30):
-    gray = cv2.cvtColor(image, cv2.COLOR_BGR2GRAY)
+    # Content touching all four edges leaves nothing to crop, so skip the full-frame scan
+    edges = (image[:1], image[-1:], image[:, :1], image[:, -1:])
+    if all(cv2.cvtColor(np.ascontiguousarray(edge), cv2.COLOR_BGR2GRAY).max() > threshold for edge in edges):
+        return image
 
-    _, thresh = cv2.threshold(gray, threshold, 255, cv2.THRESH_BINARY)
+    gray = cv2.cvtColor(to_device(image), cv2.COLOR_BGR2GRAY)
 
-    coords = cv2.findNonZero(thresh)
+    rows = np.flatnonzero(to_host(cv2.reduce(gray, 1, cv2.REDUCE_MAX)).ravel() > threshold)
 
-    if coords is None:
+    if rows.size == 0:
         return image
 
-    x, y, w, h = cv2.boundingRect(coords)
+    # Black rows cannot widen the column extent, so only the content band is scanned
+    band = to_host(gray)[rows[0]:rows[-1] + 1]
+    cols = np.flatnonzero(cv2.reduce(band, 0, cv2.REDUCE_MAX).ravel() > threshold)
 
-    cropped = image[y:y+h, x:x+w]
+    cropped = image[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1]
 
     return cropped
 
 
-def frames_are_identical(frame1, frame2, threshold=0.95):
-    if frame1.shape != frame2.shape:
-        return False
+def write_thumbnail(image, output_dir, frame_name, size=400):
+    thumbs_dir = os.path.join(output_dir, ".thumbs")
+    os.makedirs(thumbs_dir, exist_ok=True)
+
+    height, width = image.shape[:2]
+    scale = min(1.0, size / width, size / height)
+    if scale < 1.0:
+        new_width = round(width * scale)
+        new_height = round(height * scale)
+        image = cv2.resize(image, (new_width, new_height), interpolation=cv2.INTER_AREA)
+
+    thumb_path = os.path.join(thumbs_dir, Path(frame_name).stem + ".jpg")
+    cv2.imwrite(thumb_path, image, [cv2.IMWRITE_JPEG_QUALITY, 82])
+
+
+def save_frame(image, output_dir, frame_name, write_params=()):
+    cv2.imwrite(os.path.join(output_dir, frame_name), image, list(write_params))
+    write_thumbnail(image, output_dir, frame_name)
+
+
+def fast_ssim(gray1, gray2, win_size=7):
+    # Same result as skimage's default SSIM: uniform window, sample covariance, 8-bit range
+    a = gray1.astype(np.float64)
+    b = gray2.astype(np.float64)
+    window = (win_size, win_size)
+
+    mu_a = cv2.boxFilter(a, -1, window, borderType=cv2.BORDER_REFLECT_101)
+    mu_b = cv2.boxFilter(b, -1, window, borderType=cv2.BORDER_REFLECT_101)
+    cov_norm = win_size * win_size / (win_size * win_size - 1)
+    var_a = cov_norm * (cv2.boxFilter(a * a, -1, window, borderType=cv2.BORDER_REFLECT_101) - mu_a * mu_a)
+    var_b = cov_norm * (cv2.boxFilter(b * b, -1, window, borderType=cv2.BORDER_REFLECT_101) - mu_b * mu_b)
+    cov = cov_norm * (cv2.boxFilter(a * b, -1, window, borderType=cv2.BORDER_REFLECT_101) - mu_a * mu_b)
+
+    c1 = (0.01 * 255) ** 2
+    c2 = (0.03 * 255) ** 2
+    ssim_map = ((2 * mu_a * mu_b + c1) * (2 * cov + c2)) / ((mu_a * mu_a + mu_b * mu_b + c1) * (var_a + var_b + c2))
+
+    pad = (win_size - 1) // 2
+    return float(ssim_map[pad:-pad, pad:-pad].mean())
+
+
+def center_crop_margins(height, width, margin):
+    return int(height * margin), int(width * margin)
+
 
-    gray1 = cv2.cvtColor(frame1, cv2.COLOR_BGR2GRAY)
-    gray2 = cv2.cvtColor(frame2, cv2.COLOR_BGR2GRAY)
+def center_crop(frame, margin):
+    height, width = frame.shape[:2]
+    top, left = center_crop_margins(height, width, margin)
+    return frame[top:height - top, left:width - left]
+
+
+def margin_fraction(value):
+    margin = float(value)
+    if not 0 <= margin < 0.5:
+        raise argparse.ArgumentTypeError(f"must be at least 0 and below 0.5, got {value}")
+    return margin
+
+
+def comparison_gray(frame, max_height=480, scratch=None, margin=0.2):
+    scale = min(1.0, max_height / frame.shape[0])
+
+    # Letterboxing and burned-in subtitles sit at the edges, so only the centre is compared at the same 480p detail
+    if margin != 0:
+        frame = center_crop(frame, margin)
+
+    height, width = frame.shape[:2]
+
+    # The full-size gray is only an intermediate when downscaling, so a caller's scratch buffer can hold it
+    if scale < 1.0 and scratch is not None and scratch.shape == (height, width) and not cv2.ocl.useOpenCL():
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=scratch)
+    else:
+        gray = cv2.cvtColor(to_device(frame), cv2.COLOR_BGR2GRAY)
 
-    height, width = gray1.shape
-    scale = min(1.0, 480 / height)
     if scale < 1.0:
-        new_height = int(height * scale)
-        new_width = int(width * scale)
-        gray1 = cv2.resize(gray1, (new_width, new_height))
-        gray2 = cv2.resize(gray2, (new_width, new_height))
+        gray = cv2.resize(gray, (int(width * scale), int(height * scale)))
+
+    return to_host(gray)
+
+
+def frames_are_identical(gray1, gray2, threshold=0.95, mad_threshold=8.0, tiny_mad_threshold=1.0):
+    if gray1.shape != gray2.shape:
+        return False
+
+    if cv2.mean(cv2.absdiff(gray1, gray2))[0] > mad_threshold:
+        return False
+
+    # Frames that still match at 32x32 are only compression noise apart, skip SSIM
+    tiny1 = cv2.resize(gray1, (32, 32), interpolation=cv2.INTER_AREA)
+    tiny2 = cv2.resize(gray2, (32, 32), interpolation=cv2.INTER_AREA)
+    if cv2.mean(cv2.absdiff(tiny1, tiny2))[0] < tiny_mad_threshold:
+        return True
 
-    similarity = ssim(gray1, gray2)
+    similarity = fast_ssim(gray1, gray2)
 
     return similarity > threshold
 
 
-def extract_unique_frames(video_path, output_dir, threshold=0.95, sample_interval=None, start_time=None, end_time=None):
+def frame_hash(frame, hash_size=16):
+    small = to_host(cv2.resize(to_device(frame), (hash_size + 1, hash_size), interpolation=cv2.INTER_AREA))
+    small = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY)
+    diff = small[:, 1:] > small[:, :-1]
+    return int.from_bytes(np.packbits(diff).tobytes(), "big")
+
+
+def hash_distance(hash1, hash2):
+    return (hash1 ^ hash2).bit_count()
+
+
+def frame_write_params(frame_format, png_level=3):
+    if frame_format == "jpg":
+        return (cv2.IMWRITE_JPEG_QUALITY, 92)
+    if frame_format == "webp":
+        return (cv2.IMWRITE_WEBP_QUALITY, 92)
+    return (cv2.IMWRITE_PNG_COMPRESSION, png_level)
+
+
+def extract_unique_frames(video_path, output_dir, threshold=0.95, sample_interval=None, start_time=None, end_time=None, accurate=False, hash_threshold=10, frame_format="jpg", png_level=3, hash_fence=10, hw_decode=False, compare_margin=0.2):
+    if not 0 <= compare_margin < 0.5:
+        raise ValueError(f"Comparison margin must be at least 0 and below 0.5, got {compare_margin}")
+
     os.makedirs(output_dir, exist_ok=True)
 
-    cap = cv2.VideoCapture(video_path)
+    if hw_decode:
+        cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG, [cv2.CAP_PROP_HW_ACCELERATION, cv2.VIDEO_ACCELERATION_ANY])
+    else:
+        cap = cv2.VideoCapture(video_path)
 
     if not cap.isOpened():
         print(f"Error: Could not open video file {video_path}")
         return
 
+    frame_height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    frame_width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    top, left = center_crop_margins(frame_height, frame_width, compare_margin)
+    gray_scratch = np.empty((frame_height - 2 * top, frame_width - 2 * left), dtype=np.uint8)
+
+    if hw_decode:
+        if cap.get(cv2.CAP_PROP_HW_ACCELERATION) == cv2.VIDEO_ACCELERATION_NONE:
+            print("Hardware decoding is not available, decoding on the CPU")
+        else:
+            print("Decoding video on the GPU")
+
     fps = cap.get(cv2.CAP_PROP_FPS)
     total_frames = int(cap.get(cv2.CAP_PROP_FRAME_COUNT))
 
@@ -86,205 +240,319 @@ def extract_unique_frames(video_path, output_dir, threshold=0.95, sample_interva
         print(f"Ending at {end_time}s (frame {end_frame})")
 
     if sample_interval is not None:
-        skip_frames = int(fps * sample_interval)
+        skip_frames = max(1, int(fps * sample_interval))
         print(f"Sampling every {sample_interval} seconds ({skip_frames} frames at {fps:.2f} FPS)")
     else:
         skip_frames = 1
         print(f"Processing every frame at {fps:.2f} FPS")
 
-    frame_count = start_frame
+    write_params = frame_write_params(frame_format, png_level)
+
+    if accurate:
+        print(f"Comparing frames with SSIM (threshold {threshold})")
+    else:
+        print(f"Comparing frames with perceptual hash (max Hamming distance {hash_threshold}, SSIM up to {hash_threshold + hash_fence})")
+
     saved_count = 0
-    prev_frame = None
+    processed_count = 0
+    prev_gray = None
+    prev_hash = None
+    position = start_frame
+    seek_gap = int(fps * 10)
 
     print(f"Processing frames {start_frame} to {end_frame}...")
 
-    while frame_count < end_frame:
-        ret, frame = cap.read()
+    write_workers = os.cpu_count() or 4
+    pending_writes = deque()
+
+    with ThreadPoolExecutor(max_workers=write_workers) as executor:
+        for target in range(start_frame, end_frame, skip_frames):
+            if target - position > seek_gap:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, target)
+            else:
+                while position < target and cap.grab():
+                    position += 1
+
+            ret, frame = cap.read()
+
+            if not ret:
+                break
+
+            position = target + 1
+            processed_count += 1
+
+            if accurate:
+                current_gray = comparison_gray(frame, scratch=gray_scratch, margin=compare_margin)
+                is_duplicate = prev_gray is not None and frames_are_identical(prev_gray, current_gray, threshold)
+            else:
+                current_hash = frame_hash(frame)
+                current_gray = None
+                distance = hash_distance(prev_hash, current_hash) if prev_hash is not None else None
+                is_duplicate = distance is not None and distance <= hash_threshold
+
+                # Borderline hash distances are settled by SSIM
+                if distance is not None and hash_threshold < distance <= hash_threshold + hash_fence:
+                    current_gray = comparison_gray(frame, scratch=gray_scratch, margin=compare_margin)
+                    is_duplicate = frames_are_identical(prev_gray, current_gray, threshold)
+
+            if not is_duplicate:
+                cropped_frame = crop_black_borders(frame)
+                frame_name = f"frame_{saved_count:06d}.{frame_format}"
+                pending_writes.append(executor.submit(save_frame, cropped_frame, output_dir, frame_name, write_params))
+                # Bound the queue so decoding cannot run far ahead of the encoders
+                while len(pending_writes) > write_workers * 2:
+                    pending_writes.popleft().result()
+                saved_count += 1
+                if accurate:
+                    prev_gray = current_gray
+                else:
+                    # Only the reduced gray is kept for fence checks, not the full frame
+                    prev_hash = current_hash
+                    prev_gray = current_gray if current_gray is not None else comparison_gray(frame, scratch=gray_scratch, margin=compare_margin)
+
+            if processed_count % 100 == 0:
+                print(f"Processed {target + 1 - start_frame}/{end_frame - start_frame} frames, saved {saved_count} unique frames")
+
+    for future in pending_writes:
+        future.result()
 
-        if not ret:
-            break
+    cap.release()
+    print(f"\nDone! Saved {saved_count} unique frames out of {processed_count} sampled frames")
 
-        frame_count += 1
 
-        if (frame_count - start_frame) % skip_frames != 0:
-            continue
+def extract_scene_frames(video_path, output_dir, scene_threshold=0.1, sample_interval=None, start_time=None, end_time=None, frame_format="jpg", png_level=3):
+    if shutil.which("ffmpeg") is None:
+        print("Error: ffmpeg was not found on PATH")
+        return
 
-        if prev_frame is None or not frames_are_identical(prev_frame, frame, threshold):
-            cropped_frame = crop_black_borders(frame)
-            output_path = os.path.join(output_dir, f"frame_{saved_count:06d}.png")
-            cv2.imwrite(output_path, cropped_frame)
-            saved_count += 1
-            prev_frame = frame.copy()
+    os.makedirs(output_dir, exist_ok=True)
 
-        if (frame_count - start_frame) % (100 * skip_frames) == 0:
-            print(f"Processed {frame_count - start_frame}/{end_frame - start_frame} frames, saved {saved_count} unique frames")
+    cap = cv2.VideoCapture(video_path)
 
+    if not cap.isOpened():
+        print(f"Error: Could not open video file {video_path}")
+        return
+
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
     cap.release()
-    print(f"\nDone! Saved {saved_count} unique frames out of {frame_count - start_frame} processed frames")
 
+    # FFmpeg decodes and scores scene changes natively; only selected frames reach Python
+    filters = []
+    if sample_interval is not None:
+        filters.append(f"fps=1/{sample_interval}")
+    filters.append(f"select='eq(n,0)+gt(scene,{scene_threshold})'")
 
-def create_pdf(frames_dir, output_pdf, orientation="portrait", page_breaks=None, crop=None, preview_only=False):
-    import tempfile
-    import os as os_module
-    import shutil
+    command = ["ffmpeg", "-v", "error"]
+    if start_time is not None:
+        command += ["-ss", str(start_time)]
+    if end_time is not None:
+        command += ["-t", str(end_time - (start_time or 0))]
+    command += ["-i", video_path, "-vf", ",".join(filters), "-vsync", "vfr", "-f", "rawvideo", "-pix_fmt", "bgr24", "pipe:1"]
 
-    frames_path = Path(frames_dir)
-    image_files = sorted(frames_path.glob("*.png"))
+    print(f"Selecting frames with FFmpeg scene detection (scene score > {scene_threshold})")
 
-    if not image_files:
-        print(f"No images found in {frames_dir}")
-        return
+    write_params = frame_write_params(frame_format, png_level)
+    write_workers = os.cpu_count() or 4
+    pending_writes = deque()
+    frame_size = width * height * 3
+    saved_count = 0
 
-    print(f"Creating PDF with {len(image_files)} frames...")
+    with subprocess.Popen(command, stdout=subprocess.PIPE) as process, ThreadPoolExecutor(max_workers=write_workers) as executor:
+        while True:
+            data = process.stdout.read(frame_size)
+            if len(data) < frame_size:
+                break
 
-    # Determine if we need to crop
-    needs_crop = crop and (crop.get('top', 0) > 0 or crop.get('bottom', 0) > 0 or crop.get('left', 0) > 0 or crop.get('right', 0) > 0)
+            frame = np.frombuffer(data, dtype=np.uint8).reshape(height, width, 3)
+            frame_name = f"frame_{saved_count:06d}.{frame_format}"
+            pending_writes.append(executor.submit(save_frame, crop_black_borders(frame), output_dir, frame_name, write_params))
+            saved_count += 1
+            while len(pending_writes) > write_workers * 2:
+                pending_writes.popleft().result()
 
-    # Create temp directory for processing
-    temp_dir = tempfile.mkdtemp(prefix='pdf_gen_')
-    print(f"Using temp directory: {temp_dir}")
+            if saved_count % 10 == 0:
+                print(f"Saved {saved_count} unique frames")
 
-    try:
-        # Process all images: crop if needed and save to temp directory
-        print("Processing images...")
-        processed_images = []
+    for future in pending_writes:
+        future.result()
 
-        for idx, img_path in enumerate(image_files):
-            if idx % 10 == 0:
-                print(f"Processing image {idx + 1}/{len(image_files)}...")
+    if process.returncode != 0:
+        print(f"Error: ffmpeg exited with code {process.returncode}")
 
-            img = Image.open(img_path)
+    print(f"\nDone! Saved {saved_count} unique frames")
 
-            # Apply crop if needed
-            if needs_crop:
-                width, height = img.size
-                left = crop.get('left', 0)
-                top = crop.get('top', 0)
-                right = width - crop.get('right', 0)
-                bottom = height - crop.get('bottom', 0)
 
-                if idx == 0:
-                    print(f"Cropping: ({left}, {top}, {right}, {bottom}) from {(width, height)}")
+def pdf_image(img_path, crop_box=None):
+    if crop_box is None:
+        return str(img_path)
 
-                img = img.crop((left, top, right, bottom))
+    with Image.open(img_path) as img:
+        cropped = img.crop(crop_box)
+        if img.format != "JPEG":
+            return ImageReader(cropped)
 
-                if idx == 0:
-                    print(f"Result: {img.size}")
+    # Keep JPEG crops as JPEG so ReportLab embeds the bytes instead of deflating raw pixels
+    buffer = io.BytesIO()
+    cropped.save(buffer, "JPEG", quality=92)
+    buffer.seek(0)
+    return ImageReader(buffer)
 
-                # Save back to original if not preview
-                if not preview_only:
-                    img.save(str(img_path), 'PNG')
 
-            # Save processed image to temp directory
-            temp_img_path = os_module.path.join(temp_dir, f"img_{idx:06d}.png")
-            img.save(temp_img_path, 'PNG')
-            processed_images.append((temp_img_path, img.size[0], img.size[1]))
-            img.close()
+def prepare_pdf_image(img_path, crop=None, preview_only=False):
+    crop_box = None
 
-        # Convert page_breaks to a set
-        page_break_set = set(page_breaks) if page_breaks else set()
+    with Image.open(img_path) as img:
+        width, height = img.size
 
-        if orientation == "portrait":
-            page_width, page_height = A4
-        else:
-            page_height, page_width = A4
+        if crop:
+            crop_box = (crop.get('left', 0), crop.get('top', 0), width - crop.get('right', 0), height - crop.get('bottom', 0))
+            width, height = crop_box[2] - crop_box[0], crop_box[3] - crop_box[1]
+
+            # Save back to original if not preview
+            if not preview_only:
+                img.crop(crop_box).save(str(img_path), quality=92)
+                crop_box = None
+
+    digest = hashlib.md5(img_path.read_bytes()).hexdigest()
+    return (img_path, crop_box), width, height, digest
+
+
+def draw_pdf_section(c, page_size, image_sources, widths, heights, section_start, section_end, page_num):
+    page_width, page_height = page_size
+    max_width = page_width * 0.9
+    max_height = page_height * 0.9
+
+    # Scale to fit page width; images taller than a page get their own page, scaled to fit
+    section_widths = widths[section_start:section_end]
+    section_heights = heights[section_start:section_end]
+    scales = np.minimum(1.0, max_width / section_widths)
+    solo_scales = np.minimum(max_width / section_widths, max_height / section_heights)
+
+    # Prefix sums of scaled heights let each page end be found with one search
+    cum_heights = np.concatenate(([0.0], np.cumsum(section_heights * scales)))
 
-        c = canvas.Canvas(output_pdf, pagesize=(page_width, page_height))
+    idx = 0
+    while idx < section_end - section_start:
+        page_end = int(np.searchsorted(cum_heights, cum_heights[idx] + max_height, side="right")) - 1
+        page_scales = scales
 
-        # Generate PDF pages - fit as many images as possible per page
-        print("Generating PDF pages...")
+        if page_end <= idx:
+            page_end = idx + 1
+            page_scales = solo_scales
 
-        # Get manual page break boundaries
-        manual_breaks = sorted(list(page_break_set))
-        section_starts = [0] + [b + 1 for b in manual_breaks]
-        section_ends = [b + 1 for b in manual_breaks] + [len(processed_images)]
+        page_images = [
+            (image_sources[section_start + i], section_widths[i] * page_scales[i], section_heights[i] * page_scales[i])
+            for i in range(idx, page_end)
+        ]
+        idx = page_end
 
-        page_num = 0
-        max_width = page_width * 0.9
-        max_height = page_height * 0.9
+        # Render page
+        page_num += 1
+        total_height = sum(h for _, _, h in page_images)
+        print(f"Creating page {page_num} with {len(page_images)} frames")
 
-        for section_idx in range(len(section_starts)):
-            section_start = section_starts[section_idx]
-            section_end = section_ends[section_idx]
+        y_offset = (page_height - total_height) / 2
 
-            # Get images for this section
-            section_images = processed_images[section_start:section_end]
+        for img_source, img_width, img_height in page_images:
+            x_offset = (page_width - img_width) / 2
+            y_position = page_height - y_offset - img_height
 
-            print(f"Section {section_idx + 1}: frames {section_start}-{section_end-1}")
+            c.drawImage(pdf_image(*img_source), x_offset, y_position, width=img_width, height=img_height)
+
+            y_offset += img_height
+
+        c.showPage()
+
+    return page_num
+
+
+def create_pdf(frames_dir, output_pdf, orientation="portrait", page_breaks=None, crop=None, preview_only=False):
+    frames_path = Path(frames_dir)
+    with os.scandir(frames_path) as entries:
+        image_names = sorted(
+            entry.name for entry in entries
+            if entry.name.endswith(FRAME_EXTENSIONS) and entry.is_file(follow_symlinks=False)
+        )
+    image_files = [frames_path / name for name in image_names]
 
-            # Pack images into pages, fitting as many as possible
-            idx = 0
-            while idx < len(section_images):
-                page_images = []
-                current_height = 0
+    if not image_files:
+        print(f"No images found in {frames_dir}")
+        return
 
-                # Add images to current page until we run out of space
-                while idx < len(section_images):
-                    img_path, img_width, img_height = section_images[idx]
+    print(f"Creating PDF with {len(image_files)} frames...")
 
-                    # Scale to fit page width
-                    scale = min(1.0, max_width / img_width)
-                    scaled_width = img_width * scale
-                    scaled_height = img_height * scale
+    # Determine if we need to crop
+    needs_crop = crop and (crop.get('top', 0) > 0 or crop.get('bottom', 0) > 0 or crop.get('left', 0) > 0 or crop.get('right', 0) > 0)
 
-                    # Check if this image fits on current page
-                    if current_height + scaled_height <= max_height:
-                        page_images.append((img_path, scaled_width, scaled_height))
-                        current_height += scaled_height
-                        idx += 1
-                    else:
-                        break
+    if needs_crop:
+        print(f"Cropping: {crop}")
 
-                # If we couldn't fit any images, force add one (image too tall for page)
-                if not page_images and idx < len(section_images):
-                    img_path, img_width, img_height = section_images[idx]
-                    scale = min(max_width / img_width, max_height / img_height)
-                    scaled_width = img_width * scale
-                    scaled_height = img_height * scale
-                    page_images.append((img_path, scaled_width, scaled_height))
-                    idx += 1
+    # Convert page_breaks to a set
+    page_break_set = set(page_breaks) if page_breaks else set()
 
-                # Render page
-                if page_images:
-                    page_num += 1
-                    total_height = sum(h for _, _, h in page_images)
-                    print(f"Creating page {page_num} with {len(page_images)} frames")
+    if orientation == "portrait":
+        page_width, page_height = A4
+    else:
+        page_height, page_width = A4
 
-                    y_offset = (page_height - total_height) / 2
+    c = canvas.Canvas(output_pdf, pagesize=(page_width, page_height), pageCompression=1)
 
-                    for img_path, img_width, img_height in page_images:
-                        x_offset = (page_width - img_width) / 2
-                        y_position = page_height - y_offset - img_height
+    # Get manual page break boundaries
+    manual_breaks = sorted(list(page_break_set))
+    section_starts = [min(b + 1, len(image_files)) for b in [-1] + manual_breaks]
+    section_ends = [min(b + 1, len(image_files)) for b in manual_breaks] + [len(image_files)]
 
-                        c.drawImage(img_path, x_offset, y_position, width=img_width, height=img_height)
+    page_num = 0
+    section_idx = 0
 
-                        y_offset += img_height
+    print("Processing images...")
+    image_sources = []
+    widths = np.empty(len(image_files))
+    heights = np.empty(len(image_files))
+    shared_sources = {}
 
-                    c.showPage()
+    with ThreadPoolExecutor() as executor:
+        results = executor.map(prepare_pdf_image, image_files, repeat(crop if needs_crop else None), repeat(preview_only))
+        for idx, (source, width, height, digest) in enumerate(results):
+            if idx % 10 == 0:
+                print(f"Processing image {idx + 1}/{len(image_files)}...")
+            # Identical files share one source so ReportLab embeds them once
+            image_sources.append(shared_sources.setdefault((digest, source[1]), source))
+            widths[idx] = width
+            heights[idx] = height
 
-        print("Saving PDF...")
-        c.save()
-        print(f"PDF created: {output_pdf}")
+            while section_idx < len(section_starts) and section_ends[section_idx] <= idx + 1:
+                section_start = section_starts[section_idx]
+                section_end = section_ends[section_idx]
+                print(f"Section {section_idx + 1}: frames {section_start}-{section_end-1}")
+                page_num = draw_pdf_section(c, (page_width, page_height), image_sources, widths, heights, section_start, section_end, page_num)
+                section_idx += 1
 
-    finally:
-        # Clean up temp directory
-        print("Cleaning up temp files...")
-        try:
-            shutil.rmtree(temp_dir)
-        except Exception as e:
-            print(f"Warning: Could not remove temp directory: {e}")
+    print("Saving PDF...")
+    c.save()
+    print(f"PDF created: {output_pdf}")
 
 
 def main():
     parser = argparse.ArgumentParser(description="Download YouTube video and extract unique frames")
     parser.add_argument("url", nargs="?", help="YouTube video URL")
     parser.add_argument("-o", "--output", default="frames", help="Output directory for frames (default: frames)")
-    parser.add_argument("-v", "--video", default="video.mp4", help="Temporary video file path (default: video.mp4)")
-    parser.add_argument("--keep-video", action="store_true", help="Keep downloaded video file after extraction")
-    parser.add_argument("--threshold", type=float, default=0.95, help="SSIM similarity threshold, higher=more similar required (default: 0.95)")
+    parser.add_argument("-v", "--video", default="video.mp4", help="Video file path when downloading (default: video.mp4)")
+    parser.add_argument("--keep-video", action="store_true", help="Also save the video file (downloaded alongside extraction when streaming works)")
+    parser.add_argument("--threshold", type=float, default=0.95, help="SSIM similarity threshold for --accurate and borderline hash matches, higher=more similar required (default: 0.95)")
+    parser.add_argument("--accurate", action="store_true", help="Compare frames with SSIM instead of the faster perceptual hash")
+    parser.add_argument("--compare-margin", type=margin_fraction, default=0.2, help="Fraction trimmed from each edge before SSIM so borders and subtitles are ignored, 0 compares the whole frame (default: 0.2)")
+    parser.add_argument("--hash-threshold", type=int, default=10, help="Max perceptual hash Hamming distance for frames to count as identical (default: 10)")
+    parser.add_argument("--ffmpeg-scene", action="store_true", help="Let FFmpeg's scene-change filter pick unique frames instead of the Python comparison (requires ffmpeg)")
+    parser.add_argument("--scene-threshold", type=float, default=0.1, help="FFmpeg scene score above which a frame counts as new, used with --ffmpeg-scene (default: 0.1)")
     parser.add_argument("--sample-interval", type=float, default=1.5, help="Sample interval in seconds (default: 1.5). Use 0 to process every frame")
     parser.add_argument("--start-time", type=float, help="Start time in seconds")
     parser.add_argument("--end-time", type=float, help="End time in seconds")
+    parser.add_argument("--hw-decode", action="store_true", help="Decode the video with GPU hardware acceleration when available")
+    parser.add_argument("--opencl", action="store_true", help="Run frame resizing and grayscale conversion through OpenCL when a device is available")
+    parser.add_argument("--frame-format", choices=["jpg", "png", "webp"], default="jpg", help="Image format for extracted frames, png is lossless but slower to encode (default: jpg)")
+    parser.add_argument("--png-level", type=int, choices=range(10), default=3, metavar="{0..9}", help="PNG compression level, lower=faster (default: 3)")
     parser.add_argument("--pdf", action="store_true", help="Create a PDF from extracted frames")
     parser.add_argument("--pdf-output", default="output.pdf", help="PDF output filename (default: output.pdf)")
     parser.add_argument("--orientation", choices=["portrait", "landscape"], default="portrait", help="PDF page orientation (default: portrait)")
@@ -299,6 +567,10 @@ def main():
     if not args.url:
         parser.error("URL is required unless using --edit")
 
+    cv2.ocl.setUseOpenCL(args.opencl)
+    if args.opencl and not cv2.ocl.useOpenCL():
+        print("OpenCL is not available, using the CPU")
+
     if os.path.exists(args.output):
         response = input(f"Directory '{args.output}' already exists. Delete it? (y/n): ").strip().lower()
         if response == 'y' or response == 'yes':
@@ -308,19 +580,41 @@ def main():
             print("Exiting...")
             sys.exit(0)
 
-    print(f"Downloading video from: {args.url}")
-    video_path = download_video(args.url, args.video)
+    print(f"Streaming video from: {args.url}")
+    video_path = stream_url(args.url)
+    if video_path is None:
+        print("Direct stream unavailable, downloading instead")
+
+    # --keep-video still wants the file on disk, so fetch it in the background while extracting from the stream
+    downloader = None
+    download = None
+    downloaded = video_path is None
+    if downloaded:
+        print(f"Downloading video from: {args.url}")
+        video_path = download_video(args.url, args.video)
+    elif args.keep_video:
+        print(f"Downloading video to {args.video} in the background")
+        downloader = ThreadPoolExecutor(max_workers=1)
+        download = downloader.submit(download_video, args.url, args.video, True)
 
     sample_interval = None if args.sample_interval == 0 else args.sample_interval
 
     print(f"\nExtracting unique frames to: {args.output}")
-    extract_unique_frames(video_path, args.output, args.threshold, sample_interval, args.start_time, args.end_time)
+    if args.ffmpeg_scene:
+        extract_scene_frames(video_path, args.output, args.scene_threshold, sample_interval, args.start_time, args.end_time, args.frame_format, args.png_level)
+    else:
+        extract_unique_frames(video_path, args.output, args.threshold, sample_interval, args.start_time, args.end_time, args.accurate, args.hash_threshold, args.frame_format, args.png_level, hw_decode=args.hw_decode, compare_margin=args.compare_margin)
 
     if args.pdf:
         print(f"\nCreating PDF with {args.orientation} orientation...")
         create_pdf(args.output, args.pdf_output, args.orientation)
 
-    if not args.keep_video:
+    if download is not None:
+        download.result()
+        downloader.shutdown()
+        print(f"Saved video to: {args.video}")
+
+    if downloaded and not args.keep_video:
         os.remove(video_path)
         print(f"Removed temporary video file: {video_path}")
 